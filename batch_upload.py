@@ -54,10 +54,6 @@ def batch_upload(csv_directory):
     print("\nInitializing Firebase...")
     db = initialize_firebase()
 
-    # Initialize Firebase
-    print("\nInitializing Firebase...")
-    db = initialize_firebase()
-
     total_permits = 0
 
     for csv_file in csv_files:
@@ -76,7 +72,7 @@ def batch_upload(csv_directory):
 
         # Clear existing data for this city
         print(f"  🧹 Clearing existing data for {city_name}...")
-        existing_docs = db.collection('admin_leads').where('city', '==', city_name).get()
+        existing_docs = db.collection('admin_leads').where('city', '==', city_name).select(['__name__']).stream()
         batch = db.batch()
         count = 0
         for doc in existing_docs:
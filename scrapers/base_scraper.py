@@ -15,6 +15,7 @@ import logging
 class BaseScraper(ABC):
     def __init__(self, city_name):
         self.city_name = city_name
+        self.city_slug = city_name.lower().replace(' ', '')
         self.base_url = ""
         self.session = requests.Session()
         self.session.headers.update({
@@ -39,28 +40,35 @@ class BaseScraper(ABC):
             self.logger.warning("No permits to save")
             return None
 
-        # Create output directory
-        city_dir = os.path.join(output_dir, self.city_name.lower().replace(' ', ''))
-        os.makedirs(city_dir, exist_ok=True)
-
-        # Create date-based subdirectory
+        # Create date-based output directory (makedirs creates the city dir too)
+        city_dir = os.path.join(output_dir, self.city_slug)
         today = datetime.now().strftime('%Y-%m-%d')
         output_subdir = os.path.join(city_dir, today)
         os.makedirs(output_subdir, exist_ok=True)
 
         # Save to CSV
-        filename = f"{today}_{self.city_name.lower().replace(' ', '')}.csv"
+        filename = f"{today}_{self.city_slug}.csv"
         filepath = os.path.join(output_subdir, filename)
 
         if permits:
             fieldnames = ['date', 'city', 'permit_type', 'permit_number', 'address', 'description']
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for permit in permits:
-                    # Ensure all required fields are present
-                    permit['city'] = self.city_name
-                    writer.writerow(permit)
+            # Write to a temp file and swap it in, so readers never see a partial CSV
+            tmp_filepath = filepath + '.tmp'
+            try:
+                with open(tmp_filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    # City column always comes from the scraper; missing fields are written as ''
+                    writer.writerows(
+                        [self.city_name if field == 'city' else permit.get(field, '') for field in fieldnames]
+                        for permit in permits
+                    )
+                os.replace(tmp_filepath, filepath)
+            except Exception:
+                # Don't leave a stray .tmp next to the real CSVs
+                if os.path.exists(tmp_filepath):
+                    os.remove(tmp_filepath)
+                raise
 
         self.logger.info(f"Saved {len(permits)} permits to {filepath}")
         return filepath
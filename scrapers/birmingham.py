@@ -15,7 +15,7 @@ class BirminghamScraper(BaseScraper):
 
     @retry_with_backoff(max_retries=3, initial_delay=2, exceptions=(requests.RequestException,))
     def _fetch_batch(self, endpoint_url, params):
-        response = requests.get(endpoint_url, params=params, timeout=30)
+        response = self.session.get(endpoint_url, params=params, timeout=30)
         response.raise_for_status()
         return response.json()
 
@@ -25,29 +25,38 @@ class BirminghamScraper(BaseScraper):
         start_date = end_date - timedelta(days=days_back)
         start_str = start_date.strftime('%Y-%m-%dT00:00:00.000')
 
+        # Query params are the same for every page - only the offset changes
+        base_params = {
+            '$where': f"issued_date >= '{start_str}'",
+            '$order': 'issued_date DESC',
+            '$limit': 1000
+        }
+
+        # Bind the hot-loop lookups once instead of per record
+        seen_permit_ids = self.seen_permit_ids
+        add_seen = seen_permit_ids.add
+        add_permit = self.permits.append
+
         for endpoint in self.endpoints:
             try:
                 offset = 0
                 while len(self.permits) < max_permits:
-                    params = {
-                        '$where': f"issued_date >= '{start_str}'",
-                        '$order': 'issued_date DESC',
-                        '$limit': 1000,
-                        '$offset': offset
-                    }
+                    params = {**base_params, '$offset': offset}
                     data = self._fetch_batch(endpoint, params)
                     if not data:
                         break
                     for record in data:
-                        pid = record.get('permit_number')
-                        if pid and pid not in self.seen_permit_ids:
-                            self.seen_permit_ids.add(pid)
-                            self.permits.append({
+                        get = record.get
+                        pid = get('permit_number')
+                        if pid and pid not in seen_permit_ids:
+                            add_seen(pid)
+                            issued_date = get('issued_date')
+                            add_permit({
                                 'permit_number': pid,
-                                'address': record.get('address') or 'N/A',
-                                'permit_type': record.get('permit_type') or 'N/A',
-                                'description': f"Value: {record.get('construction_value', '$0.00')}, Status: {record.get('status') or 'N/A'}",
-                                'date': record.get('issued_date','').split('T')[0] if record.get('issued_date') else 'N/A',
+                                'address': get('address') or 'N/A',
+                                'permit_type': get('permit_type') or 'N/A',
+                                'description': f"Value: {get('construction_value', '$0.00')}, Status: {get('status') or 'N/A'}",
+                                'date': issued_date.split('T')[0] if issued_date else 'N/A',
                                 'city': 'Birmingham'
                             })
                     if len(data) < 1000:
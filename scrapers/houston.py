@@ -4,9 +4,23 @@ import csv
 import time
 import os
 import re
-from utils import retry_with_backoff, setup_logger, ScraperHealthCheck, save_partial_results, validate_state
+from utils import retry_with_backoff, setup_logger, ScraperHealthCheck, save_partial_results, validate_state, RateLimiter, format_arcgis_date
 from base_scraper import BaseScraper
 
+# Candidate attribute names per output field, in order of preference (layers differ)
+FIELD_ALIASES = {
+    'permit_id': ('OBJECTID', 'OBJECTID_1', 'ObjectID', 'PERMIT_ID', 'Permit_ID', 'permit_id', 'ID'),
+    'date': ('Sold_Date', 'Sold_Date_SZ', 'DATE', 'Date', 'PERMIT_DATE', 'Permit_Date', 'ISSUED_DATE'),
+    'permit_type': ('FCC__Desc', 'F_PERMIT_TY', 'PERMIT_TYPE', 'Permit_Type', 'TYPE', 'Type'),
+    'address': ('ADDRESS', 'Address', 'address'),
+    'project': ('F_PROJ_NAME', 'PROJ_NAME', 'PROJECT_NAME', 'Project_Name'),
+    'dwellings': ('F_NO_DWEL', 'F_DWELLINGS', 'NO_DWELLINGS', 'DWELLINGS', 'Dwellings'),
+    'buildings': ('F_NO_BLDG', 'F_BUILDINGS', 'NO_BUILDINGS', 'BUILDINGS', 'Buildings')
+}
+
+# Fields hashed into a synthetic ID when a record has no usable ID field
+PERMIT_KEY_FIELDS = ('ADDRESS', 'F_PROJ_NAME', 'FCC__Desc')
+
 class HoustonScraper(BaseScraper):
     def __init__(self):
         super().__init__('houston')
@@ -32,11 +46,12 @@ class HoustonScraper(BaseScraper):
         self.permits = []
         self.seen_permit_ids = set()
         self.endpoint_health = {}  # Track endpoint reliability
+        self.rate_limiter = RateLimiter(min_interval=0.5)
 
     @retry_with_backoff(max_retries=3, initial_delay=2, exceptions=(requests.RequestException,))
     def _fetch_arcgis_batch(self, url, params):
         """Fetch a single ArcGIS batch with retry logic"""
-        response = requests.get(url, params=params, timeout=30)
+        response = self.session.get(url, params=params, timeout=30)
         response.raise_for_status()
         return response.json()
 
@@ -49,7 +64,7 @@ class HoustonScraper(BaseScraper):
         for backup_url in self.backup_endpoints:
             try:
                 self.logger.debug(f"Checking backup source: {backup_url}")
-                response = requests.get(backup_url, timeout=10)
+                response = self.session.get(backup_url, timeout=10)
 
                 if response.status_code == 200:
                     # Look for ArcGIS service URLs in the page content
@@ -91,7 +106,8 @@ class HoustonScraper(BaseScraper):
         self.logger.info("🏗️  Houston TX Construction Permits Scraper")
         print(f"🏗️  Houston TX Construction Permits Scraper")
         print(f"=" * 60)
-        print(f"📅 Date Range: {(datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')} to {datetime.now().strftime('%Y-%m-%d')}")
+        now = datetime.now()
+        print(f"📅 Date Range: {(now - timedelta(days=days_back)).strftime('%Y-%m-%d')} to {now.strftime('%Y-%m-%d')}")
         print(f"📡 Trying multiple Houston data sources...")
 
         total_permits_before = len(self.permits)
@@ -172,6 +188,7 @@ class HoustonScraper(BaseScraper):
         consecutive_failures = 0
         max_consecutive_failures = 3
         endpoint_permits = []
+        fields = None
 
         while len(endpoint_permits) < max_permits_per_endpoint:
             try:
@@ -184,6 +201,7 @@ class HoustonScraper(BaseScraper):
                     'f': 'json'
                 }
 
+                self.rate_limiter.wait()
                 data = self._fetch_arcgis_batch(url, params)
 
                 if 'features' not in data or not data['features']:
@@ -193,18 +211,23 @@ class HoustonScraper(BaseScraper):
                 # Reset failure counter on success
                 consecutive_failures = 0
 
+                # Every feature in a layer carries the same attribute keys - resolve aliases once
+                if fields is None:
+                    fields = self._resolve_fields(data['features'][0].get('attributes', {}))
+                    self.logger.debug(f"{endpoint_name} field mapping: {fields}")
+
                 for feature in data['features']:
                     attrs = feature.get('attributes', {})
                     
                     # Auto-detect field mapping with fallback logic
-                    permit_id = self._extract_permit_id(attrs, endpoint_name)
-                    date_value = self._extract_date_value(attrs, endpoint_name)
+                    permit_id = self._extract_permit_id(attrs, fields['permit_id'])
+                    date_value = self._extract_date_value(attrs, fields['date'])
                     
                     if permit_id not in self.seen_permit_ids:
                         self.seen_permit_ids.add(permit_id)
 
                         # Extract address first
-                        address = attrs.get('ADDRESS') or attrs.get('Address') or attrs.get('address') or 'N/A'
+                        address = next((attrs.get(field) for field in fields['address'] if attrs.get(field)), 'N/A')
 
                         # STATE VALIDATION: Only accept Texas addresses
                         if not validate_state(address, 'houston', self.logger):
@@ -213,18 +236,18 @@ class HoustonScraper(BaseScraper):
                         endpoint_permits.append({
                             'permit_number': permit_id,
                             'address': address,
-                            'permit_type': self._extract_permit_type(attrs),
-                            'description': self._extract_description(attrs),
+                            'permit_type': self._extract_permit_type(attrs, fields['permit_type']),
+                            'description': self._extract_description(attrs, fields['project'], fields['dwellings'], fields['buildings']),
                             'date': self._format_date(date_value),
                             'city': 'Houston'
                         })
 
                 self.logger.debug(f"Fetched batch at offset {offset}: {len(data['features'])} records")
 
-                if len(data['features']) < batch_size:
+                # ArcGIS sets exceededTransferLimit while more rows remain - stop once it is explicitly False (a missing flag keeps paging)
+                if len(data['features']) < batch_size or not data.get('exceededTransferLimit', True):
                     break
                 offset += batch_size
-                time.sleep(0.5)
 
             except requests.RequestException as e:
                 consecutive_failures += 1
@@ -250,26 +273,28 @@ class HoustonScraper(BaseScraper):
 
         return endpoint_permits
     
-    def _extract_permit_id(self, attrs, endpoint_name):
+    def _resolve_fields(self, attrs):
+        """Narrow each alias list to the attribute names this layer actually returns"""
+        return {
+            name: tuple(field for field in aliases if field in attrs)
+            for name, aliases in FIELD_ALIASES.items()
+        }
+
+    def _extract_permit_id(self, attrs, id_fields=FIELD_ALIASES['permit_id']):
         """Auto-detect permit ID field with fallbacks"""
         # Try known field names in order of preference
-        id_fields = ['OBJECTID', 'OBJECTID_1', 'ObjectID', 'PERMIT_ID', 'Permit_ID', 'permit_id', 'ID']
-        
         for field in id_fields:
             value = attrs.get(field)
             if value is not None and str(value).strip():
                 return str(value).strip()
         
         # Fallback: create hash from other fields
-        key_fields = ['ADDRESS', 'F_PROJ_NAME', 'FCC__Desc']
-        key_string = '|'.join(str(attrs.get(field, '')) for field in key_fields)
+        key_string = '|'.join(str(attrs.get(field, '')) for field in PERMIT_KEY_FIELDS)
         return str(hash(key_string))[-8:]  # Use last 8 chars of hash
     
-    def _extract_date_value(self, attrs, endpoint_name):
+    def _extract_date_value(self, attrs, date_fields=FIELD_ALIASES['date']):
         """Auto-detect date field with fallbacks"""
         # Try known date field names
-        date_fields = ['Sold_Date', 'Sold_Date_SZ', 'DATE', 'Date', 'PERMIT_DATE', 'Permit_Date', 'ISSUED_DATE']
-        
         for field in date_fields:
             value = attrs.get(field)
             if value is not None:
@@ -277,10 +302,8 @@ class HoustonScraper(BaseScraper):
         
         return None
     
-    def _extract_permit_type(self, attrs):
+    def _extract_permit_type(self, attrs, type_fields=FIELD_ALIASES['permit_type']):
         """Auto-detect permit type field"""
-        type_fields = ['FCC__Desc', 'F_PERMIT_TY', 'PERMIT_TYPE', 'Permit_Type', 'TYPE', 'Type']
-        
         for field in type_fields:
             value = attrs.get(field)
             if value and str(value).strip():
@@ -288,6 +311,27 @@ class HoustonScraper(BaseScraper):
         
         return 'N/A'
     
+    def _extract_description(self, attrs, project_fields=FIELD_ALIASES['project'],
+                             dwelling_fields=FIELD_ALIASES['dwellings'], building_fields=FIELD_ALIASES['buildings']):
+        """Build the 'Project: ..., Dwellings: N, Buildings: N' description"""
+        project = 'N/A'
+        for field in project_fields:
+            value = attrs.get(field)
+            if value and str(value).strip():
+                project = str(value).strip()
+                break
+        
+        return f"Project: {project}, Dwellings: {self._extract_count(attrs, dwelling_fields)}, Buildings: {self._extract_count(attrs, building_fields)}"
+    
+    def _extract_count(self, attrs, count_fields):
+        """First non-null count field, formatted as a whole number (0 is a valid count)"""
+        for field in count_fields:
+            value = attrs.get(field)
+            if value is not None:
+                return int(value) if isinstance(value, float) and value.is_integer() else value
+        
+        return 'N/A'
+    
     def _update_endpoints_if_needed(self, discovered_endpoints):
         """Update primary endpoints if auto-discovered ones are more reliable"""
         if not discovered_endpoints:
@@ -315,14 +359,7 @@ class HoustonScraper(BaseScraper):
             return 0
     
     def _format_date(self, timestamp):
-        if not timestamp:
-            return 'N/A'
-        try:
-            if isinstance(timestamp, (int, float)):
-                return datetime.fromtimestamp(int(timestamp) / 1000).strftime('%Y-%m-%d')
-            return str(timestamp)[:10]
-        except:
-            return 'N/A'
+        return format_arcgis_date(timestamp)
     
     def run(self):
         try:
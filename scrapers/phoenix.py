@@ -10,7 +10,10 @@ import csv
 import time
 import os
 from base_scraper import BaseScraper
-from utils import retry_with_backoff, validate_state
+from utils import retry_with_backoff, validate_state, save_partial_results, RateLimiter, format_arcgis_date
+
+# Characters stripped from cost strings before float() (e.g. "$1,200")
+COST_CHARS = str.maketrans('', '', '$,')
 
 class PhoenixScraper(BaseScraper):
     def __init__(self):
@@ -18,11 +21,13 @@ class PhoenixScraper(BaseScraper):
         # Phoenix uses ArcGIS REST API
         self.base_url = "https://services1.arcgis.com/mpVYz37anSdrK4d8/arcgis/rest/services/Building_Permits/FeatureServer/0/query"
         self.permits = []
+        self.seen_permit_ids = set()
+        self.rate_limiter = RateLimiter(min_interval=0.5)
         
     @retry_with_backoff(max_retries=3, initial_delay=2, exceptions=(requests.RequestException,))
     def _fetch_batch(self, params):
         """Fetch a single batch of permits with retry logic"""
-        response = requests.get(self.base_url, params=params, timeout=30)
+        response = self.session.get(self.base_url, params=params, timeout=30)
         response.raise_for_status()
         return response.json()
 
@@ -61,6 +66,11 @@ class PhoenixScraper(BaseScraper):
         consecutive_failures = 0
         max_consecutive_failures = 3
 
+        # Bind the hot-loop lookups once instead of per record
+        seen_permit_ids = self.seen_permit_ids
+        add_seen = seen_permit_ids.add
+        add_permit = self.permits.append
+
         while total_fetched < max_permits:
             try:
                 params = {
@@ -72,6 +82,7 @@ class PhoenixScraper(BaseScraper):
                     'f': 'json'
                 }
 
+                self.rate_limiter.wait()
                 data = self._fetch_batch(params)
 
                 if 'features' not in data or not data['features']:
@@ -85,8 +96,8 @@ class PhoenixScraper(BaseScraper):
                     attrs = feature.get('attributes', {})
                     permit_id = str(attrs.get('permit_number') or attrs.get('PermitNumber') or attrs.get('OBJECTID', ''))
 
-                    if permit_id not in self.seen_permit_ids:
-                        self.seen_permit_ids.add(permit_id)
+                    if permit_id not in seen_permit_ids:
+                        add_seen(permit_id)
 
                         # Extract address first
                         address = attrs.get('address') or 'N/A'
@@ -95,7 +106,7 @@ class PhoenixScraper(BaseScraper):
                         if not validate_state(address, 'phoenix', self.logger):
                             continue  # Skip this record - wrong state
 
-                        self.permits.append({
+                        add_permit({
                             'permit_number': permit_id,
                             'address': address,
                             'permit_type': attrs.get('work_type') or 'N/A',
@@ -107,10 +118,10 @@ class PhoenixScraper(BaseScraper):
                 total_fetched += len(data['features'])
                 self.logger.debug(f"Fetched batch at offset {offset}: {len(data['features'])} records")
 
-                if len(data['features']) < batch_size:
+                # ArcGIS sets exceededTransferLimit while more rows remain - stop once it is explicitly False (a missing flag keeps paging)
+                if len(data['features']) < batch_size or not data.get('exceededTransferLimit', True):
                     break
                 offset += batch_size
-                time.sleep(0.5)
 
             except requests.RequestException as e:
                 consecutive_failures += 1
@@ -169,21 +180,13 @@ class PhoenixScraper(BaseScraper):
         try:
             if isinstance(value, (int, float)):
                 return float(value)
-            return float(str(value).replace('$', '').replace(',', ''))
+            return float(str(value).translate(COST_CHARS))
         except:
             return 0
     
     def _format_date(self, timestamp):
         """Convert epoch timestamp to readable date"""
-        if not timestamp:
-            return 'N/A'
-        
-        try:
-            if isinstance(timestamp, (int, float)):
-                return datetime.fromtimestamp(int(timestamp) / 1000).strftime('%Y-%m-%d')
-            return str(timestamp)[:10]
-        except:
-            return 'N/A'
+        return format_arcgis_date(timestamp)
     
     def run(self):
         try:
@@ -21,11 +21,12 @@ class SeleniumScraperBase:
 
     def __init__(self, city_name, url, logger_name=None):
         self.city_name = city_name
+        self.city_slug = city_name.lower().replace(' ', '')
         self.url = url
         self.permits = []
         self.seen_permit_ids = set()
-        self.logger = setup_logger(logger_name or city_name.lower().replace(' ', ''))
-        self.health_check = ScraperHealthCheck(city_name.lower().replace(' ', ''))
+        self.logger = setup_logger(logger_name or self.city_slug)
+        self.health_check = ScraperHealthCheck(self.city_slug)
         self.driver = None
 
         # Selectors to try for common permit data (auto-fix attempts)
@@ -156,16 +157,24 @@ class SeleniumScraperBase:
 
         if filename is None:
             today = datetime.now().strftime('%Y-%m-%d')
-            city_slug = self.city_name.lower().replace(' ', '')
-            filename = f'leads/{city_slug}/{today}/{today}_{city_slug}.csv'
+            filename = f'leads/{self.city_slug}/{today}/{today}_{self.city_slug}.csv'
 
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            if self.permits:
-                writer = csv.DictWriter(f, fieldnames=list(self.permits[0].keys()))
-                writer.writeheader()
-                writer.writerows(self.permits)
+        # Write to a temp file and swap it in, so readers never see a partial CSV
+        tmp_filename = filename + '.tmp'
+        try:
+            with open(tmp_filename, 'w', newline='', encoding='utf-8') as f:
+                if self.permits:
+                    writer = csv.DictWriter(f, fieldnames=list(self.permits[0].keys()))
+                    writer.writeheader()
+                    writer.writerows(self.permits)
+            os.replace(tmp_filename, filename)
+        except Exception:
+            # Don't leave a stray .tmp next to the real CSVs
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
 
         self.logger.info(f"Saved {len(self.permits)} permits to {filename}")
         print(f"✅ Saved {len(self.permits)} permits to {filename}")
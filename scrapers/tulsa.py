@@ -17,6 +17,7 @@ class TulsaScraper(BaseScraper):
         super().__init__('tulsa')
         self.base_url = "https://www.cityoftulsa.org/government/departments/development-services/permitting/"
         self.permits = []
+        self.seen_permit_ids = set()
         
         # Set up Chrome options
         chrome_options = Options()
@@ -69,6 +70,9 @@ class TulsaScraper(BaseScraper):
                 print("No data rows found in Tulsa permit table")
                 return self.permits
             
+            # No date is published, so every row gets today's date - format it once
+            today = datetime.now().strftime('%Y-%m-%d')
+
             # Parse permit data
             for row in rows[1:max_permits+1]:  # Skip header, limit to max_permits
                 cols = row.find_elements(By.TAG_NAME, "td")
@@ -79,13 +83,14 @@ class TulsaScraper(BaseScraper):
                         permit_type = cols[2].text.strip() if len(cols) > 2 else 'N/A'
                         description = f"Status: {cols[3].text.strip() if len(cols) > 3 else 'N/A'}"
                         
-                        if permit_number and permit_number not in [p['permit_number'] for p in self.permits]:
+                        if permit_number and permit_number not in self.seen_permit_ids:
+                            self.seen_permit_ids.add(permit_number)
                             self.permits.append({
                                 'permit_number': permit_number,
                                 'address': address,
                                 'permit_type': permit_type,
                                 'description': description,
-                                'date': datetime.now().strftime('%Y-%m-%d'),  # No date available
+                                'date': today,  # No date available
                                 'city': 'Tulsa'
                             })
                             
@@ -4,13 +4,13 @@ Shared utilities for all scrapers - retry logic, logging, and error handling
 import time
 import logging
 import os
-from functools import wraps
+import re
+from functools import wraps, lru_cache
 from datetime import datetime
 import traceback
 
 # Setup logging
 LOG_DIR = os.path.join(os.path.dirname(__file__), '../logs')
-os.makedirs(LOG_DIR, exist_ok=True)
 
 def setup_logger(scraper_name):
     """Setup logger for a specific scraper"""
@@ -22,6 +22,7 @@ def setup_logger(scraper_name):
         return logger
 
     # File handler - one log file per scraper
+    os.makedirs(LOG_DIR, exist_ok=True)
     log_file = os.path.join(LOG_DIR, f'{scraper_name}.log')
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
@@ -74,7 +75,9 @@ def retry_with_backoff(max_retries=3, initial_delay=1, backoff_factor=2, excepti
                     if attempt == max_retries:
                         if logger:
                             logger.error(f"Final attempt failed for {func.__name__}: {e}")
-                            logger.debug(traceback.format_exc())
+                            # Only format the traceback if a DEBUG record will actually be emitted
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(traceback.format_exc())
                         raise
 
                     if logger:
@@ -135,12 +138,51 @@ def safe_request(session_or_requests, url, params=None, timeout=30, max_retries=
     return None
 
 
+@lru_cache(maxsize=4096)
+def _format_epoch_ms(timestamp_ms):
+    """Epoch milliseconds to YYYY-MM-DD (memoized - dates repeat across records)"""
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d')
+
+
+def format_arcgis_date(timestamp):
+    """Convert an ArcGIS epoch-millisecond timestamp to YYYY-MM-DD"""
+    if not timestamp:
+        return 'N/A'
+    try:
+        if isinstance(timestamp, (int, float)):
+            return _format_epoch_ms(int(timestamp))
+        return str(timestamp)[:10]
+    except:
+        return 'N/A'
+
+
+class RateLimiter:
+    """Space requests at least min_interval seconds apart"""
+
+    def __init__(self, min_interval=0.5):
+        self.min_interval = min_interval
+        self.last_request = None
+
+    def wait(self):
+        """
+        Block until the next request may be sent. Time already spent on the
+        previous request counts towards the interval, so slow responses
+        aren't followed by a redundant fixed sleep.
+        """
+        if self.last_request is not None:
+            remaining = self.min_interval - (time.monotonic() - self.last_request)
+            if remaining > 0:
+                time.sleep(remaining)
+        self.last_request = time.monotonic()
+
+
 class ScraperHealthCheck:
     """Track scraper health and success rates"""
 
     def __init__(self, scraper_name):
         self.scraper_name = scraper_name
         self.health_file = os.path.join(LOG_DIR, f'{scraper_name}_health.txt')
+        os.makedirs(LOG_DIR, exist_ok=True)
 
     def record_success(self, count):
         """Record successful scrape"""
@@ -159,15 +201,18 @@ class ScraperHealthCheck:
         if not os.path.exists(self.health_file):
             return None
 
+        # Stream the file instead of readlines() - it grows every run
+        last_success = None
         try:
             with open(self.health_file, 'r') as f:
-                lines = f.readlines()
-                for line in reversed(lines):
+                for line in f:
                     if 'SUCCESS' in line:
-                        return line.split('|')[0].strip()
+                        last_success = line
         except:
             pass
 
+        if last_success:
+            return last_success.split('|')[0].strip()
         return None
 
     def check_health(self):
@@ -209,8 +254,9 @@ def save_partial_results(permits, filename, scraper_name):
         return False
 
 
+@lru_cache(maxsize=None)
 def load_scraper_config():
-    """Load scraper configuration with state validation rules"""
+    """Load scraper configuration with state validation rules (read once per process)"""
     import json
     config_path = os.path.join(os.path.dirname(__file__), 'config.json')
 
@@ -222,6 +268,18 @@ def load_scraper_config():
         return {}
 
 
+# Per-scraper frozenset of valid states, built once from the config
+_valid_states_cache = {}
+
+# Look for common patterns: ", AZ", " AZ ", "Arizona"
+STATE_ABBREV_PATTERN = re.compile(r',\s*([A-Z]{2})(?:\s|,|$)')
+STATE_NAMES = {
+    'arizona': 'AZ', 'texas': 'TX', 'pennsylvania': 'PA',
+    'illinois': 'IL', 'north carolina': 'NC', 'washington': 'WA',
+    'tennessee': 'TN', 'georgia': 'GA', 'california': 'CA'
+}
+
+
 def validate_state(address, scraper_name, logger=None):
     """
     Validate that scraped data matches expected state for this scraper.
@@ -235,36 +293,32 @@ def validate_state(address, scraper_name, logger=None):
     Returns:
         True if state matches or cannot be determined, False if wrong state detected
     """
-    import re
-
     if not address or address == 'N/A':
         return True  # Can't validate empty addresses
 
-    # Load config
-    config = load_scraper_config()
-    if scraper_name not in config:
-        if logger:
-            logger.warning(f"No config found for {scraper_name} - skipping state validation")
-        return True
+    valid_states = _valid_states_cache.get(scraper_name)
+    if valid_states is None:
+        # Load config
+        config = load_scraper_config()
+        if scraper_name not in config:
+            if logger:
+                logger.warning(f"No config found for {scraper_name} - skipping state validation")
+            # Cache the miss too, so the lookup and warning happen once per scraper
+            valid_states = frozenset()
+        else:
+            valid_states = frozenset(config[scraper_name].get('valid_states', []))
+        _valid_states_cache[scraper_name] = valid_states
 
-    valid_states = config[scraper_name].get('valid_states', [])
     if not valid_states:
         return True
 
     # Extract state abbreviation from address
-    # Look for common patterns: ", AZ", " AZ ", "Arizona"
-    state_pattern = r',\s*([A-Z]{2})(?:\s|,|$)'
-    match = re.search(state_pattern, address)
+    match = STATE_ABBREV_PATTERN.search(address)
 
     if not match:
         # Try full state names
-        state_names = {
-            'arizona': 'AZ', 'texas': 'TX', 'pennsylvania': 'PA',
-            'illinois': 'IL', 'north carolina': 'NC', 'washington': 'WA',
-            'tennessee': 'TN', 'georgia': 'GA', 'california': 'CA'
-        }
         address_lower = address.lower()
-        for name, abbrev in state_names.items():
+        for name, abbrev in STATE_NAMES.items():
             if name in address_lower:
                 found_state = abbrev
                 break
@@ -278,12 +332,12 @@ def validate_state(address, scraper_name, logger=None):
         if logger:
             logger.warning(
                 f"❌ STATE MISMATCH: Found {found_state} in address '{address}' "
-                f"but {scraper_name} expects {valid_states}. DISCARDING."
+                f"but {scraper_name} expects {sorted(valid_states)}. DISCARDING."
             )
         else:
             print(
                 f"❌ STATE MISMATCH in {scraper_name}: "
-                f"Found {found_state}, expected {valid_states}. DISCARDING: {address}"
+                f"Found {found_state}, expected {sorted(valid_states)}. DISCARDING: {address}"
             )
         return False
 
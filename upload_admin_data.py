@@ -62,7 +62,8 @@ def upload_leads_to_firebase(db, leads):
     # Clear existing data first
     print("Clearing existing admin_leads collection...")
     leads_ref = db.collection('admin_leads')
-    docs = leads_ref.stream()
+    # Only document names are needed to delete, skip the field payloads
+    docs = leads_ref.select(['__name__']).stream()
     for doc in docs:
         batch.delete(doc.reference)
         count += 1
@@ -78,8 +79,9 @@ def upload_leads_to_firebase(db, leads):
     batch = db.batch()
     count = 0
 
+    leads_ref = db.collection('admin_leads')
     for lead in leads:
-        doc_ref = db.collection('admin_leads').document()
+        doc_ref = leads_ref.document()
         batch.set(doc_ref, lead)
         count += 1
 
@@ -100,7 +102,8 @@ def update_city_stats(db):
 
     # Get all cities and their lead counts
     cities_data = {}
-    docs = leads_ref.stream()
+    # Only the city field is needed for counting - don't pull whole lead documents
+    docs = leads_ref.select(['city']).stream()
 
     for doc in docs:
         data = doc.to_dict()
@@ -10,6 +10,18 @@ import sys
 from datetime import datetime, timedelta
 import firebase_admin
 from firebase_admin import credentials, firestore
+from upload_to_firebase import resolve_columns
+
+# CSV column aliases for each permit field, in order of preference (this script
+# accepts issued_date and lowercase type, which upload_to_firebase does not)
+CSV_COLUMN_ALIASES = {
+    'date': ('date', 'Date', 'issued_date'),
+    'city': ('city', 'City'),
+    'permit_type': ('permit_type', 'Permit Type', 'type'),
+    'permit_number': ('permit_number', 'Permit Number', 'Number'),
+    'address': ('address', 'Address'),
+    'description': ('description', 'Description'),
+}
 
 def initialize_firebase():
     """Initialize Firebase Admin SDK"""
@@ -31,16 +43,10 @@ def parse_csv_file(csv_path, days_back=30):
     try:
         with open(csv_path, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
+            columns = resolve_columns(reader.fieldnames or [], CSV_COLUMN_ALIASES)
 
             for row in reader:
-                permit = {
-                    'date': row.get('date', row.get('Date', row.get('issued_date', ''))),
-                    'city': row.get('city', row.get('City', '')),
-                    'permit_type': row.get('permit_type', row.get('Permit Type', row.get('type', ''))),
-                    'permit_number': row.get('permit_number', row.get('Permit Number', row.get('Number', ''))),
-                    'address': row.get('address', row.get('Address', '')),
-                    'description': row.get('description', row.get('Description', ''))
-                }
+                permit = {field: row[column] if column else '' for field, column in columns}
 
                 if not any(permit.values()):
                     continue
@@ -65,12 +71,14 @@ def upload_to_firebase(db, permits, city_name):
 
     batch = db.batch()
     count = 0
+    leads_ref = db.collection('admin_leads')
+    today = datetime.now().strftime('%Y-%m-%d')
 
     for permit in permits:
-        doc_ref = db.collection('admin_leads').document()
+        doc_ref = leads_ref.document()
 
         if not permit.get('date'):
-            permit['date'] = datetime.now().strftime('%Y-%m-%d')
+            permit['date'] = today
 
         if not permit.get('city'):
             permit['city'] = city_name
@@ -151,6 +159,7 @@ def batch_upload_recent(csv_directory):
     total_all_leads = 0
     total_recent_leads = 0
     city_totals = {}
+    city_recent_permits = {}  # Recent permits per city, kept from the first parse
 
     for csv_file in csv_files:
         filename = os.path.basename(csv_file)
@@ -171,13 +180,15 @@ def batch_upload_recent(csv_directory):
         # Aggregate city totals
         if city_name not in city_totals:
             city_totals[city_name] = {'all': 0, 'recent': 0}
+            city_recent_permits[city_name] = []
 
         city_totals[city_name]['all'] += len(all_permits)
         city_totals[city_name]['recent'] += len(recent_permits)
+        city_recent_permits[city_name].extend(recent_permits)
 
     # Clear existing Firebase data
     print(f"\n🧹 Clearing existing Firebase data...")
-    existing_docs = db.collection('admin_leads').stream()
+    existing_docs = db.collection('admin_leads').select(['__name__']).stream()
     batch = db.batch()
     count = 0
     for doc in existing_docs:
@@ -194,15 +205,8 @@ def batch_upload_recent(csv_directory):
     for city_name, totals in city_totals.items():
         print(f"\n🏙️  {city_name}")
 
-        # Re-parse files for this city to get recent permits
-        city_recent_permits = []
-        for csv_file in csv_files:
-            if get_city_name_from_filename(os.path.basename(csv_file)) == city_name:
-                _, recent = parse_csv_file(csv_file, days_back=30)
-                city_recent_permits.extend(recent)
-
         # Upload recent permits to Firebase
-        uploaded = upload_to_firebase(db, city_recent_permits, city_name)
+        uploaded = upload_to_firebase(db, city_recent_permits[city_name], city_name)
 
         # Update city stats with TOTAL count
         update_city_stats(db, city_name, totals['all'], uploaded)
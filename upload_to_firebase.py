@@ -11,6 +11,16 @@ from datetime import datetime
 import firebase_admin
 from firebase_admin import credentials, firestore
 
+# CSV column aliases for each permit field, in order of preference
+CSV_COLUMN_ALIASES = {
+    'date': ('date', 'Date'),
+    'city': ('city', 'City'),
+    'permit_type': ('permit_type', 'Permit Type', 'Type'),
+    'permit_number': ('permit_number', 'Permit Number', 'Number'),
+    'address': ('address', 'Address'),
+    'description': ('description', 'Description'),
+}
+
 def initialize_firebase():
     """Initialize Firebase Admin SDK"""
     try:
@@ -23,23 +33,24 @@ def initialize_firebase():
 
     return firestore.client()
 
+def resolve_columns(fieldnames, column_aliases=CSV_COLUMN_ALIASES):
+    """Map each permit field to the first alias present in the CSV header"""
+    return [
+        (field, next((alias for alias in aliases if alias in fieldnames), None))
+        for field, aliases in column_aliases.items()
+    ]
+
 def parse_csv_file(csv_path):
     """Parse a CSV file and return permit data"""
     permits = []
     try:
         with open(csv_path, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
+            columns = resolve_columns(reader.fieldnames or [])
 
             for row in reader:
                 # Clean and standardize the data
-                permit = {
-                    'date': row.get('date', row.get('Date', '')),
-                    'city': row.get('city', row.get('City', '')),
-                    'permit_type': row.get('permit_type', row.get('Permit Type', row.get('Type', ''))),
-                    'permit_number': row.get('permit_number', row.get('Permit Number', row.get('Number', ''))),
-                    'address': row.get('address', row.get('Address', '')),
-                    'description': row.get('description', row.get('Description', ''))
-                }
+                permit = {field: row[column] if column else '' for field, column in columns}
 
                 # Skip empty rows
                 if not any(permit.values()):
@@ -57,14 +68,16 @@ def upload_to_firebase(db, permits, city_name):
     """Upload permits to Firebase"""
     batch = db.batch()
     count = 0
+    leads_ref = db.collection('admin_leads')
+    today = datetime.now().strftime('%Y-%m-%d')
 
     for permit in permits:
         # Create a document reference
-        doc_ref = db.collection('admin_leads').document()
+        doc_ref = leads_ref.document()
 
         # Add timestamp if not present
         if not permit.get('date'):
-            permit['date'] = datetime.now().strftime('%Y-%m-%d')
+            permit['date'] = today
 
         # Ensure city is set
         if not permit.get('city'):
@@ -141,7 +154,7 @@ def main():
 
     # Clear existing data for this city (optional - comment out if you want to append)
     print(f"Clearing existing data for {city_name}...")
-    existing_docs = db.collection('admin_leads').where('city', '==', city_name).get()
+    existing_docs = db.collection('admin_leads').where('city', '==', city_name).select(['__name__']).stream()
     batch = db.batch()
     count = 0
     for doc in existing_docs: